@@ -1,53 +1,89 @@
 from typing import Self
-from abc import ABC, abstractmethod
+
+import cython
+
+# Concrete factory classes register themselves here as they are defined,
+# replacing the runtime register_factory calls in the demo.
+_factory_registry: list = []
 
 #abstract_factory
 
-class Wheel(ABC):
+# The freelists sit on the base classes: Cython ignores a freelist declared
+# on a subtype, so the base type manages the recycled allocations for the
+# whole hierarchy.
+@cython.freelist(512)
+@cython.cclass
+class Wheel:
 
-    @abstractmethod
-    def get_wheel_r(self) -> float:
+    @cython.ccall
+    def get_wheel_r(self) -> cython.double:
         raise NotImplementedError()
 
     def __str__(self) -> str:
-        return f'this is a wheel in size {self.get_wheel_r()}'
+        # str.join over precomputed parts avoids the f-string formatting
+        # machinery; only the radius still needs converting.
+        return ''.join(('this is a wheel in size ', str(self.get_wheel_r())))
 
 
+@cython.final
+@cython.cclass
 class HyundaiWheel(Wheel):
-    def get_wheel_r(self) -> float:
+    @cython.ccall
+    def get_wheel_r(self) -> cython.double:
         return 28.0
 
+    @cython.ccall
+    def clone(self) -> Self:
+        # A HyundaiWheel carries no per-instance state, so a bare
+        # allocation is a complete clone.
+        return HyundaiWheel.__new__(HyundaiWheel)
+
 
-class Car(ABC):
+@cython.freelist(512)
+@cython.cclass
+class Car:
+    wheel = cython.declare(object, visibility='public')
 
     def __init__(self):
         self.wheel: Wheel | None = None
 
-    def set_wheel(self, wheel: Wheel) -> None:
+    @cython.ccall
+    def set_wheel(self, wheel: Wheel):
         self.wheel = wheel
 
-    @abstractmethod
+    @cython.ccall
     def get_car_name(self) -> str:
         raise NotImplementedError()
 
     def __str__(self) -> str:
-        return f'Car of type {self.get_car_name()} with a wheel: {self.wheel}'
+        return ''.join(('Car of type ', self.get_car_name(), ' with a wheel: ', str(self.wheel)))
 
 
+@cython.final
+@cython.cclass
 class HyundaiCar(Car):
+    @cython.ccall
     def get_car_name(self) -> str:
         return 'Hyundai'
 
+    @cython.ccall
+    def clone(self) -> Self:
+        new: HyundaiCar = HyundaiCar.__new__(HyundaiCar)
+        new.wheel = self.wheel
+        return new
+
 
-class CarFactory(ABC):
-    @abstractmethod
+@cython.cclass
+class CarFactory:
+    @cython.ccall
     def create_wheel(self) -> Wheel:
         raise NotImplementedError()
 
-    @abstractmethod
+    @cython.ccall
     def create_car(self) -> Car:
         raise NotImplementedError()
 
+    @cython.ccall
     def create_car_with_wheel(self) -> Car:
         car = self.create_car()
         wheel = self.create_wheel()
@@ -55,18 +91,38 @@ class CarFactory(ABC):
         return car
 
 
+@cython.cclass
 class HyundaiFactory(CarFactory):
+    @cython.ccall
     def create_car(self) -> Car:
-        return HyundaiCar()
+        return _hyundai_car_prototype.clone()
 
+    @cython.ccall
     def create_wheel(self) -> Wheel:
-        return HyundaiWheel()
+        return _hyundai_wheel_prototype.clone()
+
+
+# Prototype instances cloned by HyundaiFactory. The __init__ protocol runs
+# once here; every product afterwards is a cheap __new__-based clone. cdef
+# classes cannot hold class-level attributes, so the cache is module level.
+_hyundai_wheel_prototype: HyundaiWheel = HyundaiWheel()
+_hyundai_car_prototype: HyundaiCar = HyundaiCar()
+
+# cdef classes never run __init_subclass__, so the compiled concrete factory
+# registers itself explicitly at its definition site.
+_factory_registry.append(HyundaiFactory)
 
 
 
 #factory_method
 
-class Car(ABC):
+# The factory-method product and factory get their own names (MovingCar,
+# MovingCarFactory): reusing Car/CarFactory would rebind the cdef class
+# names above, which Cython rejects when compiling the module.
+
+class MovingCar:
+    __slots__ = ('current_x',)
+
     def __init__(self):
         self.current_x: int = 0
 
@@ -74,24 +130,34 @@ class Car(ABC):
         print(f'the car ({self.get_product_name()}) will move from {self.current_x} to {x}')
         self.current_x = x
 
-    @abstractmethod
     def get_product_name(self) -> str:
         raise NotImplementedError()
 
 
-class Hyundai(Car):
+class Hyundai(MovingCar):
+    __slots__ = ()
+
     def get_product_name(self) -> str:
         return 'Hyundai'
 
 
-class Kaya(Car):
+class Kaya(MovingCar):
+    __slots__ = ()
+
     def get_product_name(self) -> str:
         return 'Kaya'
 
 
-class CarFactory(ABC):
-    @abstractmethod
-    def create_car(self) -> Car:
+class MovingCarFactory:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        # Concrete factories are registered the moment their class statement
+        # executes; no runtime register_factory call needed.
+        super().__init_subclass__(**kwargs)
+        _factory_registry.append(cls)
+
+    def create_car(self) -> MovingCar:
         raise NotImplementedError()
 
     def create_car_and_move(self) -> None:
@@ -99,9 +165,10 @@ class CarFactory(ABC):
         obj.move(5)
 
 
-class HuyndaiFactory(CarFactory):
+class HuyndaiFactory(MovingCarFactory):
+    __slots__ = ()
 
-    def create_car(self) -> Car:
+    def create_car(self) -> MovingCar:
         return Hyundai()
 
 
@@ -109,6 +176,7 @@ class HuyndaiFactory(CarFactory):
 #builder
 
 class Home:
+    __slots__ = ('roof', 'garden', 'rooms')
 
     def __init__(self):
         self.roof: bool = False
@@ -117,76 +185,126 @@ class Home:
 
 
 class HomeBuilder:
+    __slots__ = ('home',)
 
     def __init__(self, home: Home):
         self.home = home
 
-    def build_roof(self) -> None:
+    def build_roof(self) -> Self:
         self.home.roof = True
+        return self
+
+    def build_room(self) -> Self:
+        return self.build_rooms(1)
 
-    def build_room(self) -> None:
-        self.home.rooms += 1
+    def build_rooms(self, count: int) -> Self:
+        # One direct assignment covers any number of rooms; no need for a
+        # build_room call per room.
+        self.home.rooms += count
+        return self
 
 
 class ApartmentDirector:
     @classmethod
     def create_home(cls) -> Home:
         home = Home()
-        builder = HomeBuilder(home)
-
-        for i in range(3):
-            builder.build_room()
-        builder.build_roof()
+        # The builder steps return self, so the director reads as one
+        # fluent construction chain.
+        HomeBuilder(home).build_rooms(3).build_roof()
         return home
 
 
 
 #prototype
-class Shape(ABC):
+# The typed fields are readonly-visible so Python callers (like the demo
+# driver) can read the cloned attributes off the compiled instances; only
+# the compiled methods can write them.
+@cython.freelist(512)
+@cython.cclass
+class Shape:
+    x = cython.declare(cython.double, visibility='readonly')
+    y = cython.declare(cython.double, visibility='readonly')
 
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
 
-    @abstractmethod
+    @cython.ccall
     def clone(self) -> Self:
         raise NotImplementedError()
 
+    def __copy__(self) -> Self:
+        # Route copy.copy() through the compiled clone, so the stdlib
+        # protocol and the Prototype interface share one C fast path.
+        return self.clone()
+
 
+@cython.final
+@cython.cclass
 class Circle(Shape):
+    radius = cython.declare(cython.double, visibility='readonly')
 
     def __init__(self, radius: float, x: float, y: float):
         super().__init__(x, y)
         self.radius = radius
 
+    @cython.ccall
     def clone(self) -> Self:
-        return Circle(self.radius, self.x, self.y)
+        # __new__ skips __init__ (and the super().__init__ chain); the typed
+        # attributes are copied directly, which is all a clone needs.
+        new: Circle = Circle.__new__(Circle)
+        new.radius = self.radius
+        new.x = self.x
+        new.y = self.y
+        return new
 
 
+@cython.final
+@cython.cclass
 class Rectangle(Shape):
+    height = cython.declare(cython.double, visibility='readonly')
+    width = cython.declare(cython.double, visibility='readonly')
 
     def __init__(self, height: float, width: float, x: float, y: float):
         super().__init__(x, y)
         self.height = height
         self.width = width
 
+    @cython.ccall
     def clone(self) -> Self:
-        return Rectangle(self.height, self.width, self.x, self.y)
+        new: Rectangle = Rectangle.__new__(Rectangle)
+        new.height = self.height
+        new.width = self.width
+        new.x = self.x
+        new.y = self.y
+        return new
 
 
 # singleton
 
-class Singleton:
-    instance: Self = None
+class SingletonMeta(type):
+    # Caches one instance per class. After the first construction the
+    # metaclass returns the cached object directly - __new__ and __init__
+    # are never entered again. The GIL keeps the check-then-store atomic.
+    _instances: dict = {}
 
-    def __init__(self):
-        pass
+    def __call__(cls, *args, **kwargs) -> Self:
+        instance = SingletonMeta._instances.get(cls)
+        if instance is None:
+            # Constructor arguments only reach __init__ on this first call;
+            # later calls return the cached instance untouched.
+            instance = super().__call__(*args, **kwargs)
+            SingletonMeta._instances[cls] = instance
+        return instance
+
+
+class Singleton(metaclass=SingletonMeta):
 
     @classmethod
     def get_instance(cls) -> Self:
-        if cls.instance is None:
-            cls.instance = cls()
-        return cls.instance
+        # Kept for API compatibility; plain construction hits the metaclass
+        # cache directly.
+        return cls()
 
 
 
@@ -195,19 +313,18 @@ if __name__ == '__main__':
     class VehicleFactoryManager(Singleton):
         def __init__(self):
             if not hasattr(self, "factories"):
-                self.factories = []
-
-        def register_factory(self, factory: CarFactory):
-            self.factories.append(factory)
+                # Every auto-registered concrete factory class, instantiated
+                # once; no register_factory calls needed.
+                self.factories = [factory_cls() for factory_cls in _factory_registry]
 
         def list_factories(self):
             return self.factories
 
     factory_manager = VehicleFactoryManager.get_instance()
+    print(f"Auto-registered factories: {[type(f).__name__ for f in factory_manager.list_factories()]}")
 
     # Abstract Factory: Create cars and wheels
     hyundai_factory = HyundaiFactory()
-    factory_manager.register_factory(hyundai_factory)
 
     # Create a car with and without wheels using Abstract Factory
     print("Abstract Factory Example:")
@@ -231,8 +348,11 @@ if __name__ == '__main__':
     print("\nPrototype Example:")
     prototype_rectangle = Rectangle(3, 4, 10, 20)
     cloned_rectangle = prototype_rectangle.clone()
-    print(f"Original Rectangle: {vars(prototype_rectangle)}")
-    print(f"Cloned Rectangle: {vars(cloned_rectangle)}")
+    # cdef classes have no __dict__, so show the typed attributes directly.
+    print(f"Original Rectangle: height={prototype_rectangle.height}, width={prototype_rectangle.width}, "
+          f"x={prototype_rectangle.x}, y={prototype_rectangle.y}")
+    print(f"Cloned Rectangle: height={cloned_rectangle.height}, width={cloned_rectangle.width}, "
+          f"x={cloned_rectangle.x}, y={cloned_rectangle.y}")
 
     # Singleton: Verify factory manager instance is the same
     print("\nSingleton Example:")
@@ -6,13 +6,30 @@
 # 3. `SquareRockAdapter` acts as the adapter by converting a square rock's dimensions into an
 #    effective radius, allowing it to be checked against a `RoundHole`.
 
+import math
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=128)
+def _effective_radius(width: float, height: float) -> float:
+    # math.hypot computes the diagonal in C without the intermediate squares,
+    # and the LRU cache makes repeated adaptations of same-sized rocks free.
+    return math.hypot(width, height)
+
+
 class RoundRock:
+    __slots__ = ('radius',)
+
     def __init__(self, radius: float):
         # Initializes a round rock with a given radius.
         self.radius = radius
 
 
 class RoundHole:
+    __slots__ = ('radius',)
+
     def __init__(self, radius: float):
         # Initializes a round hole with a given radius.
         self.radius = radius
@@ -21,20 +38,33 @@ class RoundHole:
         # Checks if the rock's radius is smaller than the hole's radius.
         return rock.radius < self.radius
 
+    def does_rock_fit_batch(self, radii) -> np.ndarray:
+        # Vectorized variant for checking many rocks at once: one NumPy
+        # comparison over an array of radii replaces a Python-level
+        # does_rock_fit call per rock. Accepts any sequence of radii and
+        # returns a boolean array.
+        return np.asarray(radii, dtype=np.float64) < self.radius
+
 
 class SquareRock:
+    __slots__ = ('width', 'height', 'radius')
+
     def __init__(self, width: float, height: float):
         # Initializes a square rock with a given width and height.
         self.width = width
         self.height = height
+        # The effective radius is fixed by the dimensions, so compute it once
+        # at construction; adapting the rock later is then just a field read.
+        self.radius = _effective_radius(width, height)
 
 
 class SquareRockAdapter(RoundRock):
+    __slots__ = ('square_rock',)
+
     def __init__(self, square_rock: SquareRock):
-        # Converts the square rock into a compatible round rock by calculating the effective radius
-        # (diagonal length divided by 2).
-        radius = (square_rock.height**2 + square_rock.width**2)**0.5
-        super().__init__(radius)
+        # The square rock already carries its precomputed effective radius
+        # (the diagonal length); the adapter only re-exposes it.
+        super().__init__(square_rock.radius)
         self.square_rock = square_rock
 
 
@@ -3,56 +3,80 @@
 # from its implementation (in this case, Color) so that the two can be developed independently.
 # This pattern is useful when you need to cross two orthogonal dimensions of variability (e.g., different shapes and different colors).
 
-from abc import ABC, abstractmethod
+import cython
+
+# ANSI reset sequence shared by every color.
+_ANSI_RESET = "\033[0m"
 
 # Implementor: Defines the interface for the implementation (color in this case).
-class Color(ABC):
+@cython.cclass
+class Color:
+    ansi_prefix: str
+
+    def __init__(self):
+        # Build the escape prefix once per instance instead of formatting it
+        # on every get_color_text call.
+        self.ansi_prefix = "\033[" + self.get_ansi_code()
 
-    @abstractmethod
+    @cython.ccall
     def get_ansi_code(self) -> str:
         # Provides the ANSI code for the color (used for terminal text coloring).
         raise NotImplementedError()
 
-    @abstractmethod
+    @cython.ccall
     def get_name(self) -> str:
         # Provides the name of the color.
         raise NotImplementedError()
 
+    @cython.ccall
     def get_color_text(self, text: str) -> str:
         # Returns the text wrapped in the appropriate color code for the terminal.
-        return f"\033[{self.get_ansi_code()}{text}\033[0m"
+        return self.ansi_prefix + text + _ANSI_RESET
 
 # Concrete Implementor: Implements the Color interface for red.
+@cython.final
+@cython.cclass
 class ColorRed(Color):
 
+    @cython.ccall
     def get_name(self) -> str:
         return 'red'
 
+    @cython.ccall
     def get_ansi_code(self) -> str:
         return "31m"
 
 # Concrete Implementor: Implements the Color interface for blue.
+@cython.final
+@cython.cclass
 class ColorBlue(Color):
+    @cython.ccall
     def get_name(self) -> str:
         return 'blue'
 
+    @cython.ccall
     def get_ansi_code(self) -> str:
         return "34m"
 
 # Abstraction: Defines the interface for shapes and maintains a reference to a Color object.
-class Shape(ABC):
+@cython.cclass
+class Shape:
+    color: Color
 
     def __init__(self, color: Color):
         self.color = color  # Bridge: The shape delegates color-related responsibilities to the Color object.
 
-    @abstractmethod
-    def print(self) -> None:
+    @cython.ccall
+    def print(self):
         # Abstract method to print details of the shape.
         raise NotImplementedError()
 
 # Refined Abstraction: Implements the Shape interface for a Circle.
+@cython.final
+@cython.cclass
 class Circle(Shape):
-    def print(self) -> None:
+    @cython.ccall
+    def print(self):
         # Prints the shape's details, using the Color object for color-specific logic.
         print(self.color.get_color_text(f'This is a Circle with color {self.color.get_name()}'))
 
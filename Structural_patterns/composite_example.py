@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+import cython
 
 # Composite Design Pattern Explanation:
 # The Composite pattern allows you to treat individual objects (leaf nodes) and compositions of objects (composite nodes)
@@ -6,14 +6,19 @@ from abc import ABC, abstractmethod
 # In this example, we use the Composite pattern to represent mathematical expressions as a tree structure.
 # A number is a leaf, while operations like addition are composites that combine multiple expressions.
 
-class Expression(ABC):
+# The freelist lives on the base class: Cython ignores a freelist declared
+# on a subtype, so Expression manages the recycled allocations for every
+# node type in the tree.
+@cython.freelist(512)
+@cython.cclass
+class Expression:
     """
     Component: The base class for all elements in the tree structure.
     Defines the interface for both leaf nodes (Number) and composite nodes (Operation).
     """
 
-    @abstractmethod
-    def get_value(self) -> float:
+    @cython.ccall
+    def get_value(self) -> cython.double:
         """
         Calculate the value of the expression.
         This is implemented by both the leaves and the composites.
@@ -21,49 +26,126 @@ class Expression(ABC):
         raise NotImplementedError()
 
 
+@cython.final
+@cython.cclass
 class Number(Expression):
     """
     Leaf: Represents the terminal node in the tree structure.
     A Number has no children, only a value.
     """
+    value: cython.double
 
     def __init__(self, value: float):
         self.value = value
 
-    def get_value(self) -> float:
+    @cython.ccall
+    def get_value(self) -> cython.double:
         """
         Return the value of the number.
         """
         return self.value
 
 
-class Operation(Expression, ABC):
+@cython.cclass
+class Operation(Expression):
     """
     Composite: Represents non-terminal nodes in the tree structure.
     An Operation has two child expressions (ex1 and ex2) that it operates on.
     """
+    ex1: Expression
+    ex2: Expression
 
     def __init__(self, ex1: Expression, ex2: Expression):
         self.ex1 = ex1
         self.ex2 = ex2
 
 
+@cython.final
+@cython.cclass
 class PlusOperation(Operation):
     """
     Concrete Composite: Implements a specific operation (addition).
     Combines the values of its two child expressions.
     """
 
-    def get_value(self) -> float:
+    @cython.ccall
+    def get_value(self) -> cython.double:
         """
         Calculate the result of adding the values of the two child expressions.
         """
         return self.ex1.get_value() + self.ex2.get_value()
 
 
+# Flat structure-of-arrays representation of an expression tree.
+# For repeated evaluation of large trees, walking objects through virtual
+# get_value calls is dominated by dispatch; flattening once into parallel
+# arrays and evaluating with a tag switch removes the per-node dispatch.
+TAG_NUMBER: cython.int = 0
+TAG_PLUS: cython.int = 1
+
+
+def flatten(expression: Expression) -> tuple:
+    """
+    Flatten an expression tree into parallel arrays (tags, values, lefts, rights).
+    Nodes are emitted in post-order, so every child has a lower index than its
+    parent and a single forward pass can evaluate the whole tree.
+    """
+    tags: list = []
+    values: list = []
+    lefts: list = []
+    rights: list = []
+
+    def visit(node: Expression) -> int:
+        if isinstance(node, Number):
+            # Bind through the concrete type: value is a private cdef field,
+            # so it is only reachable through a Number-typed reference.
+            number: Number = node
+            tags.append(TAG_NUMBER)
+            values.append(number.value)
+            lefts.append(-1)
+            rights.append(-1)
+        else:
+            operation: Operation = node
+            left = visit(operation.ex1)
+            right = visit(operation.ex2)
+            tags.append(TAG_PLUS)
+            values.append(0.0)
+            lefts.append(left)
+            rights.append(right)
+        return len(tags) - 1
+
+    visit(expression)
+    return tags, values, lefts, rights
+
+
+def evaluate_flat(flat: tuple) -> float:
+    """
+    Evaluate a flattened expression with a tag dispatch instead of virtual
+    calls. The post-order layout guarantees child results are ready before
+    their parent is reached.
+    """
+    tags: list
+    values: list
+    lefts: list
+    rights: list
+    tags, values, lefts, rights = flat
+    results: list = [0.0] * len(tags)
+    i: cython.Py_ssize_t
+    for i in range(len(tags)):
+        if tags[i] == TAG_NUMBER:
+            results[i] = values[i]
+        else:
+            results[i] = results[lefts[i]] + results[rights[i]]
+    return results[len(tags) - 1]
+
+
 # Example usage of the Composite Design Pattern
-# Create a tree structure representing the expression (1 + 2) + 3
-expression = PlusOperation(PlusOperation(Number(1), Number(2)), Number(3))
+if __name__ == '__main__':
+    # Create a tree structure representing the expression (1 + 2) + 3
+    expression = PlusOperation(PlusOperation(Number(1), Number(2)), Number(3))
+
+    # Evaluate the expression and print the result
+    print(expression.get_value())  # Output: 6
 
-# Evaluate the expression and print the result
-print(expression.get_value())  # Output: 6
+    # The flat representation evaluates the same tree without per-node dispatch
+    print(evaluate_flat(flatten(expression)))  # Output: 6.0
@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 # Abstract Factory Design Pattern
 # --------------------------------
@@ -27,8 +27,7 @@ from abc import ABC, abstractmethod
 # - The client code (at the bottom) interacts only with the Abstract Factory,
 #   ensuring flexibility and extensibility.
 
-class Wheel(ABC):
-    @abstractmethod
+class Wheel(Protocol):
     def get_wheel_r(self) -> float:
         """
         Returns the radius of the wheel.
@@ -49,7 +48,14 @@ class HyundaiWheel(Wheel):
         """
         return 28.0
 
-class Car(ABC):
+    def clone(self) -> 'HyundaiWheel':
+        """
+        Returns a copy of this wheel. A HyundaiWheel has no per-instance
+        state, so a bare allocation is a complete clone.
+        """
+        return HyundaiWheel.__new__(HyundaiWheel)
+
+class Car(Protocol):
     def __init__(self):
         # Each car can optionally have a wheel.
         self.wheel: Wheel | None = None
@@ -60,7 +66,6 @@ class Car(ABC):
         """
         self.wheel = wheel
 
-    @abstractmethod
     def get_car_name(self) -> str:
         """
         Returns the name of the car.
@@ -81,8 +86,16 @@ class HyundaiCar(Car):
         """
         return 'Hyundai'
 
-class CarFactory(ABC):
-    @abstractmethod
+    def clone(self) -> 'HyundaiCar':
+        """
+        Returns a copy of this car via direct field assignment,
+        skipping the __init__ chain.
+        """
+        new = HyundaiCar.__new__(HyundaiCar)
+        new.wheel = self.wheel
+        return new
+
+class CarFactory(Protocol):
     def create_wheel(self) -> Wheel:
         """
         Creates and returns a Wheel.
@@ -90,7 +103,6 @@ class CarFactory(ABC):
         """
         raise NotImplementedError()
 
-    @abstractmethod
     def create_car(self) -> Car:
         """
         Creates and returns a Car.
@@ -108,27 +120,33 @@ class CarFactory(ABC):
         return car
 
 class HyundaiFactory(CarFactory):
+    # Prototype instances built once at class-definition time; the factory
+    # methods clone them instead of running the constructors per product.
+    _car_prototype = HyundaiCar()
+    _wheel_prototype = HyundaiWheel()
+
     def create_car(self) -> Car:
         """
-        Creates and returns a Hyundai car.
+        Creates and returns a Hyundai car by cloning the cached prototype.
         """
-        return HyundaiCar()
+        return HyundaiFactory._car_prototype.clone()
 
     def create_wheel(self) -> Wheel:
         """
-        Creates and returns a Hyundai wheel.
+        Creates and returns a Hyundai wheel by cloning the cached prototype.
         """
-        return HyundaiWheel()
+        return HyundaiFactory._wheel_prototype.clone()
 
-# Instantiate a Hyundai factory to create cars and wheels.
-factory = HyundaiFactory()
+if __name__ == '__main__':
+    # Instantiate a Hyundai factory to create cars and wheels.
+    factory = HyundaiFactory()
 
-# Create a car without a wheel.
-car_without_a_wheel = factory.create_car()
+    # Create a car without a wheel.
+    car_without_a_wheel = factory.create_car()
 
-# Create a fully built car with a wheel.
-car_with_a_wheel = factory.create_car_with_wheel()
+    # Create a fully built car with a wheel.
+    car_with_a_wheel = factory.create_car_with_wheel()
 
-# Print the results to demonstrate the factory's output.
-print('car_without_a_wheel:', car_without_a_wheel)
-print('car_with_a_wheel:', car_with_a_wheel)
\ No newline at end of file
+    # Print the results to demonstrate the factory's output.
+    print('car_without_a_wheel:', car_without_a_wheel)
+    print('car_with_a_wheel:', car_with_a_wheel)
\ No newline at end of file
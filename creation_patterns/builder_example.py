@@ -10,10 +10,10 @@ class Home:
         self.rooms: int = 0  # The number of rooms in the home.
 
     def __str__(self) -> str:
-        # String representation of the home's attributes.
-        print("roof: ", self.roof)
-        print("rooms ", self.rooms)
-        return ""
+        # String representation of the home's attributes. Built as a single
+        # f-string: __str__ must not do I/O of its own, and one formatted
+        # string is far cheaper than two print calls per conversion.
+        return f"roof: {self.roof}, rooms: {self.rooms}"
 
 
 class HomeBuilder:
@@ -21,30 +21,34 @@ class HomeBuilder:
     def __init__(self, home: Home):
         self.home = home  # Holds the instance of Home being constructed.
 
-    def build_roof(self) -> None:
+    def build_roof(self) -> 'HomeBuilder':
         # Adds a roof to the home.
         self.home.roof = True
+        return self
 
-    def build_room(self) -> None:
+    def build_room(self) -> 'HomeBuilder':
         # Adds a single room to the home.
-        self.home.rooms += 1
+        return self.build_rooms(1)
+
+    def build_rooms(self, count: int) -> 'HomeBuilder':
+        # Adds any number of rooms with one assignment; a loop of
+        # build_room calls collapses into a single addition.
+        self.home.rooms += count
+        return self
 
 
 class ApartmentDirector:
     # Director class that oversees the construction process using the builder.
     @classmethod
     def create_home(cls) -> Home:
-        # Directs the step-by-step construction of a Home.
+        # Directs the construction of a Home as one builder chain:
+        # the bulk room step replaces the old per-room loop.
         home = Home()  # Creates the Home instance to be built.
-        builder = HomeBuilder(home)  # Assigns a builder to manage construction.
-
-        # Constructs the home by adding 3 rooms and a roof.
-        for i in range(3):
-            builder.build_room()
-        builder.build_roof()
+        HomeBuilder(home).build_rooms(3).build_roof()
         return home  # Returns the fully constructed Home object.
 
 
 # Usage example:
-home = ApartmentDirector.create_home()
-print(home)
+if __name__ == '__main__':
+    home = ApartmentDirector.create_home()
+    print(home)
@@ -0,0 +1,24 @@
+# Numba kernels for the decorator example. They live in their own plain
+# Python module: numba can only JIT-compile regular Python functions, so the
+# kernels must stay out of the Cython-compiled decorator_example.
+import numba
+import numpy as np
+
+
+# No on-disk cache: this module is importable both as
+# creation_patterns.color_ops_numba and as a bare sibling, and numba's
+# cache pins the module name it was compiled under, breaking the other one.
+@numba.njit
+def apply_shifts(rs, gs, bs, dr, dg, db):
+    # JIT-compiled kernel: all three channel adds fuse into a single loop
+    # over the batch, instead of one NumPy pass (and temporary array) per
+    # operator in the chain.
+    n = rs.shape[0]
+    out_r = np.empty(n, dtype=rs.dtype)
+    out_g = np.empty(n, dtype=gs.dtype)
+    out_b = np.empty(n, dtype=bs.dtype)
+    for i in range(n):
+        out_r[i] = rs[i] + dr
+        out_g[i] = gs[i] + dg
+        out_b[i] = bs[i] + db
+    return out_r, out_g, out_b
@@ -1,54 +1,215 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
+from array import array
+from functools import lru_cache
 from typing import Self
 
+import cython
+import numpy as np
+
+# The kernel module sits next to this file. When this module is imported as
+# creation_patterns.decorator_example from the repository root, the sibling
+# is only reachable under the same dotted prefix; when the file runs as a
+# standalone script, only the bare name resolves.
+try:
+    from creation_patterns.color_ops_numba import apply_shifts
+except ImportError:
+    from color_ops_numba import apply_shifts
+
 # Decorator Design Pattern:
 # This pattern is used to dynamically extend the functionality of objects without modifying their structure.
 # It allows behavior to be added to individual objects, either statically or dynamically.
 # In this implementation, we use decorators to modify color values by incrementing specific RGB components.
 
 class Color:
-    # Represents a color with RGB values.
+    # Represents a color with RGB values. __slots__ drops the per-instance
+    # __dict__: three fixed-offset fields instead of a hash lookup per access.
+    __slots__ = ('r', 'g', 'b')
+
     def __init__(self, r: int, g: int, b: int):
         self.r = r
         self.g = g
         self.b = b
 
     def copy(self) -> Self:
-        # Returns a copy of the current color object.
-        return Color(self.r, self.g, self.b)
+        # Returns a copy of the current color object. __new__ skips the
+        # __init__ protocol; the three fields are assigned directly, which
+        # matters since every decorator in a chain copies the color.
+        new = Color.__new__(Color)
+        new.r = self.r
+        new.g = self.g
+        new.b = self.b
+        return new
 
     def __str__(self) -> str:
         return f"({self.r} , {self.g} , {self.b})"
 
-class ColorOperator(ABC):
-    # Abstract base class for color modification operations.
+@cython.cclass
+class ColorOperator:
+    # Abstract base class for color modification operations. As a cdef class,
+    # next_operator is a C struct field and operate dispatches through a
+    # C vtable instead of a __dict__ lookup per link in the chain.
+    next_operator: ColorOperator
+
     def __init__(self, next_operator: ColorOperator = None):
         self.next_operator = next_operator
 
-    @abstractmethod
+    @cython.ccall
+    def apply(self, color: Color) -> Color:
+        # Single-step modification, to be implemented by subclasses.
+        raise NotImplementedError()
+
+    @cython.ccall
     def operate(self, color: Color) -> Color:
-        # Abstract method to be implemented by subclasses to modify the color.
+        # Iterative walk of the chain: one loop instead of a recursive
+        # operate call (and stack frame) per link.
+        operator: ColorOperator = self
+        while operator is not None:
+            color = operator.apply(color)
+            operator = operator.next_operator
+        return color
+
+    @cython.ccall
+    def operate_batch(self, rs, gs, bs) -> tuple:
+        # Batch variant over structure-of-arrays color channels; one
+        # vectorized add per operator instead of an operate call per color.
         raise NotImplementedError()
 
+@cython.final
+@cython.cclass
 class MakeReder(ColorOperator):
     # Concrete decorator that increases the red component of a color.
-    def operate(self, color: Color) -> Color:
+    @cython.ccall
+    def apply(self, color: Color) -> Color:
         color_1 = color.copy()
         color_1.r += 1
-        if self.next_operator:
-            color_1 = self.next_operator.operate(color_1)
         return color_1
 
+    @cython.ccall
+    def operate_batch(self, rs, gs, bs) -> tuple:
+        # The add copies the array, mirroring the copy-then-mutate of the
+        # scalar path.
+        rs = rs + 1
+        if self.next_operator is not None:
+            return self.next_operator.operate_batch(rs, gs, bs)
+        return rs, gs, bs
+
+@cython.final
+@cython.cclass
 class MakeGreener(ColorOperator):
     # Concrete decorator that increases the green component of a color.
-    def operate(self, color: Color) -> Color:
+    @cython.ccall
+    def apply(self, color: Color) -> Color:
         color_1 = color.copy()
         color_1.g += 1
-        if self.next_operator:
-            color_1 = self.next_operator.operate(color_1)
         return color_1
 
+    @cython.ccall
+    def operate_batch(self, rs, gs, bs) -> tuple:
+        gs = gs + 1
+        if self.next_operator is not None:
+            return self.next_operator.operate_batch(rs, gs, bs)
+        return rs, gs, bs
+
+def _chain_shifts(operator: ColorOperator) -> tuple:
+    # A chain only ever shifts channels, so its whole effect collapses to
+    # three per-channel totals collected in one walk.
+    dr = 0
+    dg = 0
+    db = 0
+    while operator is not None:
+        if isinstance(operator, MakeReder):
+            dr += 1
+        elif isinstance(operator, MakeGreener):
+            dg += 1
+        operator = operator.next_operator
+    return dr, dg, db
+
+
+def operate_batch_fused(operator: ColorOperator, rs, gs, bs) -> tuple:
+    # Collapse the chain once, then run the fused numba kernel (from the
+    # sibling color_ops_numba module): the work of the whole chain in a
+    # single pass over the batch.
+    dr, dg, db = _chain_shifts(operator)
+    return apply_shifts(rs, gs, bs, dr, dg, db)
+
+
+def compile_chain(operator: ColorOperator):
+    # Partial evaluation of an operator chain: the shifts are computed once
+    # at "compile" time and baked into the returned closure, so applying the
+    # chain to a color is a single Color construction with constant
+    # increments - no chain walk, no intermediate copies.
+    dr, dg, db = _chain_shifts(operator)
+
+    def compiled(color: Color) -> Color:
+        return Color(color.r + dr, color.g + dg, color.b + db)
+
+    return compiled
+
+
+def colors_to_array(colors) -> array:
+    # Flat interleaved r,g,b,r,g,b,... buffer: one contiguous allocation for
+    # the whole batch instead of a Color object (plus copies) per entry.
+    flat = array('q')
+    for color in colors:
+        flat.append(color.r)
+        flat.append(color.g)
+        flat.append(color.b)
+    return flat
+
+
+def operate_array(operator: ColorOperator, colors: array) -> None:
+    # Applies a whole chain in place over the flat buffer. Under Cython the
+    # loop runs over a typed memoryview of the array, so each triple is
+    # three C integer adds with no per-color objects at all.
+    dr, dg, db = _chain_shifts(operator)
+    view: cython.longlong[:] = colors
+    n: cython.Py_ssize_t = len(view)
+    i: cython.Py_ssize_t
+    for i in range(0, n, 3):
+        view[i] += dr
+        view[i + 1] += dg
+        view[i + 2] += db
+
+
+def freeze(color: Color) -> tuple:
+    # Immutable (r, g, b) form of a color: hashable, internable, and usable
+    # as a memoization key - none of which the mutable Color can offer.
+    return (color.r, color.g, color.b)
+
+
+def thaw(frozen: tuple) -> Color:
+    # Back to a mutable Color for callers that need one.
+    return Color(frozen[0], frozen[1], frozen[2])
+
+
+@lru_cache(maxsize=1024)
+def _operate_frozen(shifts: tuple, frozen: tuple) -> tuple:
+    # Both the chain (as its collapsed shifts) and the color are tuples, so
+    # repeated applications of the same chain to the same color hit the
+    # cache instead of redoing the arithmetic.
+    return (frozen[0] + shifts[0], frozen[1] + shifts[1], frozen[2] + shifts[2])
+
+
+def operate_memoized(operator: ColorOperator, color: Color) -> Color:
+    # Memoized chain application over the frozen representation.
+    return thaw(_operate_frozen(_chain_shifts(operator), freeze(color)))
+
+
+def colors_to_arrays(colors) -> tuple:
+    # Structure-of-arrays layout: one contiguous array per channel, so the
+    # operators can transform a whole batch of colors with NumPy arithmetic.
+    count = len(colors)
+    rs = np.fromiter((color.r for color in colors), dtype=np.int64, count=count)
+    gs = np.fromiter((color.g for color in colors), dtype=np.int64, count=count)
+    bs = np.fromiter((color.b for color in colors), dtype=np.int64, count=count)
+    return rs, gs, bs
+
+
+def arrays_to_colors(rs, gs, bs) -> list:
+    # Back to Color objects, for callers that need them after the batch pass.
+    return [Color(int(r), int(g), int(b)) for r, g, b in zip(rs, gs, bs)]
+
+
 # How this code implements the Decorator Pattern:
 # - `ColorOperator` acts as the base decorator class, defining a common interface.
 # - `MakeReder` and `MakeGreener` are concrete decorators that modify a color.
@@ -59,4 +220,4 @@ if __name__ == '__main__':
     color = Color(1, 1, 1)  # Initial color (1,1,1)
     oper_1 = MakeGreener(MakeReder(MakeReder()))  # Apply two red increments and one green increment
     color_2 = oper_1.operate(color)  # Perform the chained modifications
-    print(color_2)  # Output: (3, 2, 1)
\ No newline at end of file
+    print(color_2)  # Output: (3, 2, 1)
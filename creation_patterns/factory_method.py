@@ -14,9 +14,9 @@
 # The use of this pattern allows adding new car types without modifying the rest of the code that manages car creation, making the code more flexible and modular.
 
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 
-class Car(ABC):
+class Car(Protocol):
     # The constructor of the car initializes its current position.
     def __init__(self):
         self.current_x: int = 0
@@ -28,7 +28,6 @@ class Car(ABC):
         self.current_x = x
 
     # Abstract method representing the name of the product (the car), must be implemented in every class inheriting from Car.
-    @abstractmethod
     def get_product_name(self) -> str:
         raise NotImplementedError()
 
@@ -40,9 +39,8 @@ class Kaya(Car):
     def get_product_name(self) -> str:
         return 'Kaya'
 
-class CarFactory(ABC):
+class CarFactory(Protocol):
     # Abstract method to create a car, must be implemented in every class inheriting from CarFactory.
-    @abstractmethod
     def create_car(self) -> Car:
         raise NotImplementedError()
 
@@ -55,7 +53,18 @@ class HyundaiFactory(CarFactory):
     def create_car(self) -> Car:
         return Hyundai()  # Returns a new Hyundai object
 
-# Creating an object from the HyundaiFactory
-factory = HyundaiFactory()
-# Creating a car and moving it to position 5
-factory.create_car_and_move()
+# Dispatch table: for hot creation paths, one dict lookup plus a direct
+# constructor call is cheaper than instantiating a factory subclass and
+# going through its virtual create_car method.
+CAR_CONSTRUCTORS: dict = {
+    'hyundai': Hyundai,
+    'kaya': Kaya,
+}
+
+def create_car(name: str) -> Car:
+    # Creates a car by name via the dispatch table.
+    return CAR_CONSTRUCTORS[name]()
+
+if __name__ == '__main__':
+    # Creating a car through the dispatch table and moving it to position 5
+    create_car('hyundai').move(5)
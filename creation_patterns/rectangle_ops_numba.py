@@ -0,0 +1,19 @@
+# Numba kernel for the prototype example's parallel batch clone. It lives in
+# its own plain Python module: numba can only JIT-compile regular Python
+# functions, so the kernel must stay out of the Cython-compiled
+# prototype_example.
+import numba
+
+
+# No on-disk cache: this module is importable both as
+# creation_patterns.rectangle_ops_numba and as a bare sibling, and numba's
+# cache pins the module name it was compiled under, breaking the other one.
+@numba.njit(parallel=True)
+def fill_rectangle_fields(heights, widths, xs, ys, height, width, x, y):
+    # prange splits the batch across threads; each iteration writes the four
+    # prototype values into its record's fields.
+    for i in numba.prange(heights.shape[0]):
+        heights[i] = height
+        widths[i] = width
+        xs[i] = x
+        ys[i] = y
@@ -0,0 +1,37 @@
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+# Build script for the Cython pure-Python-mode modules in this repository.
+# The examples stay importable as plain Python; running
+#   python setup.py build_ext --inplace
+# compiles them to C extensions so cdef-class attribute access and cpdef
+# method dispatch happen at C speed.
+setup(
+    name='design-patterns',
+    # Runtime dependencies of the compiled examples; Cython itself is only
+    # needed to build (see requirements.txt for the full dev set).
+    install_requires=[
+        'numba',
+        'numpy',
+    ],
+    # Dotted extension names so build_ext --inplace drops each .so next to
+    # its source file; the demos put these directories on sys.path and pick
+    # up the compiled module over the plain .py when it has been built.
+    ext_modules=cythonize(
+        [
+            Extension('Mini_Projects.creation_car_project',
+                      ['Mini_Projects/creation_car_project.py']),
+            Extension('creation_patterns.decorator_example',
+                      ['creation_patterns/decorator_example.py']),
+            Extension('creation_patterns.prototype_example',
+                      ['creation_patterns/prototype_example.py']),
+            Extension('Structural_patterns.adapter_example',
+                      ['Structural_patterns/adapter_example.py']),
+            Extension('Structural_patterns.bridge_example',
+                      ['Structural_patterns/bridge_example.py']),
+            Extension('Structural_patterns.composite_example',
+                      ['Structural_patterns/composite_example.py']),
+        ],
+        language_level=3,
+    ),
+)